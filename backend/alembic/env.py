@@ -0,0 +1,64 @@
+# ============================================================================
+# Alembic Migration Environment
+# ============================================================================
+# Runs schema migrations as a one-shot job before the API workers start
+# (see the Dockerfile), instead of every worker calling create_all on startup.
+# It reuses the app's DATABASE_URL and models so there is one source of truth.
+# ============================================================================
+
+import asyncio
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import pool
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app import models  # noqa: F401 - registers the models on Base.metadata
+from app.database import DATABASE_URL, Base
+
+
+config = context.config
+
+# Set up logging from alembic.ini
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+# Used by 'alembic revision --autogenerate' to diff models against the DB
+target_metadata = Base.metadata
+
+# The app's database, unless a URL was set on the Alembic config (tests do)
+url = config.get_main_option("sqlalchemy.url") or DATABASE_URL
+
+
+def run_migrations_offline() -> None:
+    """Emit the migration SQL to stdout instead of running it ('--sql')."""
+    context.configure(
+        url=url,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection) -> None:
+    """Run the migrations on a (sync-wrapped) connection."""
+    context.configure(connection=connection, target_metadata=target_metadata)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_migrations_online() -> None:
+    """Connect with the app's async driver and run the migrations."""
+    # NullPool: this is a one-shot job, there is nothing to reuse connections for
+    connectable = create_async_engine(url, poolclass=pool.NullPool)
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+    await connectable.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    asyncio.run(run_migrations_online())
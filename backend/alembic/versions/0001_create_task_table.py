@@ -0,0 +1,45 @@
+"""Create the task table
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-14
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Databases created before migrations existed already have this table
+    # (the app used to run create_all on startup) - adopt it as-is
+    if sa.inspect(op.get_bind()).has_table("task"):
+        return
+
+    op.create_table(
+        "task",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(length=255), nullable=False),
+        sa.Column("description", sa.String(length=1000), nullable=True),
+        sa.Column("completed", sa.Boolean(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_task_id", "task", ["id"])
+    op.create_index("ix_task_completed", "task", ["completed"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_completed", table_name="task")
+    op.drop_index("ix_task_id", table_name="task")
+    op.drop_table("task")
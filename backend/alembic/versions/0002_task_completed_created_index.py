@@ -0,0 +1,41 @@
+"""Index task by (completed, created_at) for the recent tasks query
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-14
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def existing_indexes() -> set[str]:
+    """Return the names of the indexes currently on the task table."""
+    inspector = sa.inspect(op.get_bind())
+    return {index["name"] for index in inspector.get_indexes("task")}
+
+
+def upgrade() -> None:
+    # A database bootstrapped with create_all (RUN_DDL=1) from the current
+    # models already has the new index and never had the old one, and 0001
+    # adopts its table as-is - so only change what is actually missing
+    indexes = existing_indexes()
+
+    # The composite index covers every query the single-column one served
+    if "ix_task_completed_created" not in indexes:
+        op.create_index(
+            "ix_task_completed_created", "task", ["completed", "created_at"]
+        )
+    if "ix_task_completed" in indexes:
+        op.drop_index("ix_task_completed", table_name="task")
+
+
+def downgrade() -> None:
+    op.create_index("ix_task_completed", "task", ["completed"])
+    op.drop_index("ix_task_completed_created", table_name="task")
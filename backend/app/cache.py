@@ -0,0 +1,76 @@
+# ============================================================================
+# Task List Cache (In-Process)
+# ============================================================================
+# Keeps the serialized GET /tasks response for each 'limit' for a short time,
+# so repeated identical reads cost one DB round trip.
+#
+# The cache lives in the worker process, and invalidate() only clears the
+# worker that handled the write. With several Gunicorn workers (the Docker
+# default) another worker can serve a stale list right after a write - the
+# frontend re-fetches immediately after every POST/PATCH, so it would see it.
+# That's why the cache is OFF by default: only enable it (TASK_LIST_CACHE_TTL)
+# for a single-worker deployment, or move it to a shared backend like Redis.
+# ============================================================================
+
+import asyncio
+import time
+from typing import Optional
+
+
+class TaskListCache:
+    """A tiny TTL cache of serialized task lists, keyed by 'limit'.
+
+    Writes call invalidate(). A read that started before an invalidation
+    won't store its (possibly stale) result, thanks to the generation counter.
+    A ttl of 0 (or less) disables the cache.
+    """
+
+    def __init__(self, ttl: float = 0.0, max_entries: int = 32):
+        self.ttl = ttl
+        # 'limit' comes from the client, so bound the number of entries
+        self.max_entries = max_entries
+        self.generation = 0
+        self._entries: dict[int, tuple[float, bytes]] = {}
+        self._locks: dict[int, asyncio.Lock] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def lock(self, limit: int) -> asyncio.Lock:
+        """Return the lock that serializes cache misses for 'limit'.
+
+        Concurrent misses for the same limit wait for one DB query instead of
+        all querying at once; misses for different limits don't wait for
+        each other.
+        """
+        lock = self._locks.get(limit)
+        if lock is None:
+            if len(self._locks) >= self.max_entries:
+                # Forget idle locks; held ones are still in use
+                self._locks = {
+                    key: held for key, held in self._locks.items() if held.locked()
+                }
+            lock = self._locks[limit] = asyncio.Lock()
+        return lock
+
+    def get(self, limit: int) -> Optional[bytes]:
+        """Return the cached body for 'limit', or None if missing or expired."""
+        entry = self._entries.get(limit)
+        if entry and time.monotonic() - entry[0] < self.ttl:
+            return entry[1]
+        return None
+
+    def set(self, limit: int, body: bytes, generation: int) -> None:
+        """Store a body that was built while 'generation' was current."""
+        if not self.enabled or generation != self.generation:
+            # Disabled, or the data changed while we were reading it
+            return
+        if len(self._entries) >= self.max_entries:
+            self._entries.clear()
+        self._entries[limit] = (time.monotonic(), body)
+
+    def invalidate(self) -> None:
+        """Drop all cached lists (call after any write to tasks)."""
+        self.generation += 1
+        self._entries.clear()
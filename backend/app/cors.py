@@ -0,0 +1,37 @@
+# ============================================================================
+# CORS Fast Path (ASGI Layer)
+# ============================================================================
+# Only cross-origin requests carry an 'Origin' header worth inspecting, and the
+# bundled frontend is same-origin, so most requests (page loads, GET polls)
+# have none. Starlette's CORSMiddleware still parses the full header list of
+# every request before noticing that. This wrapper does one cheap scan of the
+# raw headers and only hands requests with an Origin to CORSMiddleware.
+# ============================================================================
+
+from starlette.middleware.cors import CORSMiddleware
+
+
+def has_origin_header(scope) -> bool:
+    """Return True if the raw ASGI headers include an Origin header."""
+    # ASGI servers deliver header names lowercased
+    return any(name == b"origin" for name, _ in scope["headers"])
+
+
+class FastCORSMiddleware:
+    """CORSMiddleware that is skipped entirely for requests without an Origin.
+
+    Accepts the same options as CORSMiddleware, so it is a drop-in
+    replacement for app.add_middleware(CORSMiddleware, ...).
+    """
+
+    def __init__(self, app, **cors_options):
+        self.app = app
+        self.cors = CORSMiddleware(app, **cors_options)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and has_origin_header(scope):
+            await self.cors(scope, receive, send)
+            return
+
+        # No Origin means no CORS headers to add - go straight to the app
+        await self.app(scope, receive, send)
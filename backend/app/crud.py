@@ -9,16 +9,25 @@
 # The "Single Responsibility Principle" is applied - each function does ONE thing.
 # ============================================================================
 
-from sqlalchemy.orm import Session
+from datetime import datetime, timezone
+
+from sqlalchemy import Row, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from . import models, schemas
-from typing import Optional
+from typing import Optional, Sequence
 
 
-def create_task(db: Session, task: schemas.TaskCreate) -> models.Task:
+async def create_task(db: AsyncSession, task: schemas.TaskCreate) -> models.Task:
     """Create a new task in the database.
 
     Takes the validated input from the client and creates a Task record.
-    Returns the created task with its ID and timestamp (generated by the server).
+    Returns the created task with its ID (generated by the database) and
+    timestamp.
+
+    MySQL has no INSERT ... RETURNING, so reading back server-generated values
+    costs an extra SELECT. Instead we generate the timestamp here and take the
+    ID from the INSERT result (the driver's lastrowid), so creating a task is
+    a single INSERT + COMMIT.
 
     Args:
         db: Database session for executing queries
@@ -27,43 +36,60 @@ def create_task(db: Session, task: schemas.TaskCreate) -> models.Task:
     Returns:
         The newly created Task model object with auto-generated ID
     """
-    # Create a new Task object from the provided data
-    db_task = models.Task(title=task.title, description=task.description)
-
-    # Add it to the session and commit to the database
-    db.add(db_task)
-    db.commit()
-
-    # Refresh to get the auto-generated ID and timestamp from the database
-    db.refresh(db_task)
-    return db_task
-
-
-def get_recent_tasks(db: Session, limit: int = 5) -> list[models.Task]:
+    # Naive UTC, whole seconds: exactly what a MySQL DATETIME column stores,
+    # so the response matches what later reads return. App sessions run in
+    # UTC (see database.py), so rows written via the NOW() server default
+    # use the same clock and sort consistently with these
+    created_at = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+    values = {
+        "title": task.title,
+        "description": task.description,
+        "completed": False,
+        "created_at": created_at,
+    }
+
+    # A Core INSERT skips the ORM unit-of-work and identity-map bookkeeping
+    result = await db.execute(insert(models.Task.__table__).values(**values))
+    await db.commit()
+
+    return models.Task(id=result.inserted_primary_key[0], **values)
+
+
+async def get_recent_tasks(db: AsyncSession, limit: int = 5) -> Sequence[Row]:
     """Fetch recent incomplete tasks, ordered by creation time (newest first).
 
     This is typically used for the main dashboard view. We only return
     incomplete tasks and limit the results to avoid overwhelming the frontend.
 
+    The list is read-only, so we select the columns directly and get plain
+    Row tuples back: no ORM objects are built or tracked in the session's
+    identity map. The columns are in TaskRead's field order, and the rows
+    are encoded straight to JSON by schemas.dump_task_rows.
+
     Args:
         db: Database session for executing queries
         limit: Maximum number of tasks to return (default 5)
 
     Returns:
-        List of Task objects that are not yet completed, ordered by newest first
+        Rows (id, title, description, completed, created_at) of tasks that are
+        not yet completed, ordered by newest first
     """
-    return (
-        db.query(models.Task)
+    Task = models.Task
+    result = await db.execute(
+        select(Task.id, Task.title, Task.description, Task.completed, Task.created_at)
         # Filter: only get tasks that aren't completed yet
-        .filter(models.Task.completed == False)
+        .where(Task.completed == False)
         # Sort: newest tasks first (most recent creation)
-        .order_by(models.Task.created_at.desc())
+        .order_by(Task.created_at.desc())
         # Limit: don't return too many (API parameter)
-        .limit(limit).all()
+        .limit(limit)
     )
+    return result.all()
 
 
-def mark_task_completed(db: Session, task_id: int) -> Optional[models.Task]:
+async def mark_task_completed(
+    db: AsyncSession, task_id: int
+) -> Optional[models.Task]:
     """Mark a task as completed.
 
     Finds the task by ID and updates its completed status to True.
@@ -77,7 +103,7 @@ def mark_task_completed(db: Session, task_id: int) -> Optional[models.Task]:
         The updated Task object, or None if task was not found
     """
     # Look up the task by its ID
-    task = db.query(models.Task).filter(models.Task.id == task_id).first()
+    task = await db.get(models.Task, task_id)
 
     # If not found, return None (handler will return 404 error)
     if not task:
@@ -87,8 +113,8 @@ def mark_task_completed(db: Session, task_id: int) -> Optional[models.Task]:
     task.completed = True
 
     # Persist the change to the database
-    db.commit()
+    await db.commit()
 
     # Refresh to get any server-side updates (if any)
-    db.refresh(task)
+    await db.refresh(task)
     return task
@@ -6,8 +6,9 @@
 # for database configuration that can be easily swapped or tested.
 # ============================================================================
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
 import os
 
 
@@ -20,22 +21,60 @@ DB_NAME = os.getenv("MYSQL_DATABASE", "todo_db")
 DB_PORT = os.getenv("MYSQL_PORT", "3306")
 
 # Build the database connection URL
-# We use PyMySQL driver (pure Python) to avoid C extension compilation issues in Docker
+# We use the asyncmy driver so queries run on the event loop instead of a threadpool.
+# asyncmy is compiled with Cython (prebuilt manylinux wheels, so no compiler in
+# the Docker image), so packet parsing and row decoding run in C rather than in
+# pure Python as with PyMySQL. There is no sync path (app and Alembic both use
+# this URL), so a sync C driver such as mysqlclient would not be used anywhere.
 DATABASE_URL = (
-    f"mysql+pymysql://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}?charset=utf8mb4"
+    f"mysql+asyncmy://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}?charset=utf8mb4"
 )
 
-print(
-    "DATABASE_URL =", DATABASE_URL
-)  # Log the URL for debugging (never commit sensitive data!)
+# Log the URL for debugging only when asked to - it contains credentials,
+# so the password is masked and nothing is printed in production
+if os.getenv("DEBUG"):
+    print("DATABASE_URL =", make_url(DATABASE_URL).render_as_string(hide_password=True))
 
-# Initialize the database engine with connection pooling
+# Connection pool sizing - the defaults (5 + 10 overflow) serialize DB access
+# under concurrent load, so the pool size can be tuned per deployment.
+# These are PER WORKER PROCESS: with 4 workers the defaults allow up to
+# 4 * (10 + 10) = 80 connections, safely below MySQL's max_connections (151)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+
+# Seconds to wait for a TCP connection to MySQL. The driver default (10s)
+# means a single probe against a down database eats most of the startup
+# retry budget; failing fast leaves room for more retries
+DB_CONNECT_TIMEOUT = int(os.getenv("DB_CONNECT_TIMEOUT", "2"))
+
+# Initialize the async database engine with connection pooling
 # pool_pre_ping=True ensures we detect stale connections before using them
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+# (e.g. after a MySQL restart); pool_recycle replaces connections well before
+# MySQL's wait_timeout drops them, and pool_timeout fails fast instead of
+# queueing requests for 30s when the pool is exhausted.
+# Every session runs in UTC, so NOW() (the created_at server default) agrees
+# with the naive-UTC timestamps crud.create_task writes, whatever time zone
+# the MySQL server itself is configured with
+engine = create_async_engine(
+    DATABASE_URL,
+    pool_pre_ping=True,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=1800,
+    pool_timeout=10,
+    connect_args={
+        "connect_timeout": DB_CONNECT_TIMEOUT,
+        "init_command": "SET time_zone = '+00:00'",
+    },
+)
 
 # Create a session factory that we'll use to get DB sessions throughout the app
-# autocommit=False means we control when transactions are committed (better for data integrity)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# autoflush=False means we control when changes are sent to the database
+# expire_on_commit=False keeps loaded attributes usable after commit; with an
+# AsyncSession an expired attribute can't be lazily reloaded
+AsyncSessionLocal = async_sessionmaker(
+    bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
 
 # Create a base class for all our ORM models to inherit from
 Base = declarative_base()
@@ -14,34 +14,116 @@
 # - Single Responsibility: Controllers delegate to CRUD layer
 # - Open/Closed: New endpoints can be added without modifying existing ones
 # - Interface Segregation: Schemas define clear contracts
-# - Dependency Inversion: Depends on abstractions (Session), not concrete DB
+# - Dependency Inversion: Depends on abstractions (AsyncSession), not concrete DB
 # ============================================================================
 
+import os
+import re
 import time
+import hashlib
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
+from urllib.parse import parse_qs
 
-from fastapi import FastAPI, Depends, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi import FastAPI, Depends, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import OperationalError
 
 from . import models, schemas, crud
-from .database import engine, SessionLocal, Base
+from .database import engine, AsyncSessionLocal, Base
+from .cache import TaskListCache
+from .cors import FastCORSMiddleware
+from .health_interceptor import HealthCheckInterceptor
 
 
 # Configure logging to see what's happening at runtime
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# ============================================================================
+# SECTION 1: Application Startup (Lifespan)
+# ============================================================================
+# When the API starts, we wait for the database to be ready.
+# This is important in Docker where MySQL might not be ready immediately.
+# The schema is managed by Alembic ('alembic upgrade head' runs once before
+# the workers start); set RUN_DDL=1 to create the tables here instead, e.g.
+# for a quick local run without migrations.
+
+# Give up waiting for the database after this many seconds. DB_CONNECT_TIMEOUT
+# (see database.py) only covers opening the TCP connection - the MySQL
+# handshake after it has no timeout - so each probe is also cut off at the
+# deadline. A peer that accepts TCP but never answers can't hang startup.
+DB_STARTUP_DEADLINE = 15.0
+DB_RETRY_MAX_DELAY = 0.5
+
+
+async def probe_database():
+    """Open a connection and run a trivial query to check the DB is usable."""
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize the application on startup.
+
+    - Wait up to 15 seconds for the database to become available, retrying
+      with exponential backoff (0.1s doubling up to 0.5s) so a database that
+      is already up costs a single cheap probe, and one that is partially up
+      is picked up quickly
+    - Create all tables defined in our ORM models, if RUN_DDL=1
+    """
+    deadline = time.monotonic() + DB_STARTUP_DEADLINE
+    delay = 0.1
+    attempt = 1
+    while True:
+        try:
+            remaining = max(deadline - time.monotonic(), 0)
+            await asyncio.wait_for(probe_database(), timeout=remaining)
+            logger.info("✓ Database connection successful")
+            break
+        except (OperationalError, asyncio.TimeoutError):
+            # Database not ready yet, wait and retry (unless out of time)
+            if time.monotonic() + delay >= deadline:
+                logger.warning(
+                    "Database still not reachable after %d attempts", attempt
+                )
+                break
+            logger.info(
+                "Database not ready, retrying in %.1fs... (attempt %d)",
+                delay,
+                attempt,
+            )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, DB_RETRY_MAX_DELAY)
+            attempt += 1
+
+    # Create all database tables (if they don't exist)
+    if os.getenv("RUN_DDL") == "1":
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        logger.info("✓ Database tables created")
+
+    yield
+
+
 # Initialize the FastAPI application
-app = FastAPI(title="Todo Assessment API")
+# ORJSONResponse serializes responses with orjson (C implementation, native
+# datetime support) instead of the pure Python json module
+fastapi_app = FastAPI(
+    title="Todo Assessment API",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 
 # ============================================================================
-# SECTION 1: Static File Serving (Frontend)
+# SECTION 2: Static File Serving (Frontend)
 # ============================================================================
 # Serve the frontend files alongside the API. This keeps everything in
 # one container but separates concerns (frontend in /frontend folder).
@@ -49,31 +131,123 @@ app = FastAPI(title="Todo Assessment API")
 FRONTEND_DIR = Path(__file__).resolve().parents[2] / "frontend"
 STATIC_DIR = FRONTEND_DIR / "static"
 
+# index.html links its assets with a content hash in the URL
+# (/static/app.js?v=<hash>, added at startup). Such a URL always means the
+# same bytes, so browsers may cache it forever and skip the request entirely;
+# a new deployment changes the hash and therefore the URL. Any other request
+# (unversioned or outdated hash) must be revalidated - a cheap 304 via the
+# ETag/Last-Modified headers StaticFiles already sends.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+# Matches quoted /static/... URLs in HTML (without an existing query string)
+STATIC_URL_PATTERN = re.compile(rb'(["\'])/static/([^"\'?#]+)\1')
+
+
+def hash_static_assets(directory: Path) -> dict[str, str]:
+    """Hash every file under 'directory', keyed by its relative path."""
+    return {
+        path.relative_to(directory).as_posix(): hashlib.md5(
+            path.read_bytes()
+        ).hexdigest()[:12]
+        for path in directory.rglob("*")
+        if path.is_file()
+    }
+
+
+def version_asset_urls(html: bytes, versions: dict[str, str]) -> bytes:
+    """Append ?v=<hash> to every /static/ URL in 'html' that we have a hash for."""
+
+    def add_version(match: re.Match) -> bytes:
+        quote, name = match.group(1), match.group(2)
+        version = versions.get(name.decode())
+        if version is None:
+            return match.group(0)
+        return quote + b"/static/" + name + b"?v=" + version.encode() + quote
+
+    return STATIC_URL_PATTERN.sub(add_version, html)
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that tells browsers how long they may cache each asset."""
+
+    def __init__(self, *args, asset_versions: dict[str, str], **kwargs):
+        super().__init__(*args, **kwargs)
+        self.asset_versions = asset_versions
+
+    async def get_response(self, path: str, scope):
+        response = await super().get_response(path, scope)
+        # Only cache successful lookups (200 or 304), never a 404
+        if response.status_code in (200, 304):
+            requested = parse_qs(scope["query_string"].decode()).get("v", [None])[0]
+            current = self.asset_versions.get(path.replace(os.sep, "/"))
+            if requested is not None and requested == current:
+                response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+            else:
+                response.headers["Cache-Control"] = REVALIDATE_CACHE_CONTROL
+        return response
+
+
 if FRONTEND_DIR.exists():
-    logger.info(f"Serving frontend from: {FRONTEND_DIR}")
+    logger.info("Serving frontend from: %s", FRONTEND_DIR)
+
+    # Hash the assets once at startup; they only change on deploy
+    ASSET_VERSIONS = hash_static_assets(STATIC_DIR)
 
     # Mount static files (CSS, JS) at /static
-    app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
+    fastapi_app.mount(
+        "/static",
+        CachedStaticFiles(directory=STATIC_DIR, asset_versions=ASSET_VERSIONS),
+        name="static",
+    )
+
+    # The page is tiny and only changes on deploy, so read it once at startup
+    # (with versioned asset URLs) instead of opening and streaming the file
+    # on every request
+    INDEX_HTML = version_asset_urls(
+        (FRONTEND_DIR / "index.html").read_bytes(), ASSET_VERSIONS
+    )
+    INDEX_ETAG = f'"{hashlib.md5(INDEX_HTML).hexdigest()}"'
+    INDEX_HEADERS = {"ETag": INDEX_ETAG, "Cache-Control": REVALIDATE_CACHE_CONTROL}
 
     # Serve the main HTML page at the root path
-    @app.get("/")
-    def serve_frontend():
-        """Return the main frontend HTML page."""
-        return FileResponse(FRONTEND_DIR / "index.html")
+    @fastapi_app.get("/")
+    async def serve_frontend(request: Request):
+        """Return the main frontend HTML page.
+
+        The page names the current asset versions, so it must always be
+        revalidated to pick up new deployments; an unchanged page is a 304.
+        """
+        if_none_match = request.headers.get("if-none-match", "")
+        if INDEX_ETAG in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=304, headers=INDEX_HEADERS)
+        return Response(INDEX_HTML, media_type="text/html", headers=INDEX_HEADERS)
 
 else:
-    logger.warning(f"Frontend not found at: {FRONTEND_DIR}")
+    logger.warning("Frontend not found at: %s", FRONTEND_DIR)
 
 
 # ============================================================================
-# SECTION 2: CORS Configuration
+# SECTION 3: CORS Configuration
 # ============================================================================
-# Allow cross-origin requests so the frontend can call the API.
-# In production, you'd restrict this to specific origins instead of "*".
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # TODO: In production, set this to actual domain(s)
+# The bundled frontend is served from this app (same origin), so it never
+# needs CORS. Only a separately hosted frontend (e.g. the nginx image in
+# /frontend) does, and its origin must be listed explicitly: a wildcard origin
+# combined with credentials is invalid per the CORS spec.
+# Set ALLOWED_ORIGINS to a comma-separated list, e.g.
+# "https://todo.example.com,http://localhost:3000".
+
+ALLOWED_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("ALLOWED_ORIGINS", "http://localhost:3000").split(",")
+    if origin.strip()
+]
+
+# FastCORSMiddleware skips CORS processing for requests without an Origin
+# header (see cors.py)
+fastapi_app.add_middleware(
+    FastCORSMiddleware,
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -81,61 +255,24 @@ app.add_middleware(
 
 
 # ============================================================================
-# SECTION 3: Dependency Injection (Database Session)
+# SECTION 4: Dependency Injection (Database Session)
 # ============================================================================
 # This follows the Dependency Injection principle - the app doesn't create
 # sessions directly; it asks for them via the 'Depends' system.
 # This makes it easy to mock the database in tests.
 
 
-def get_db():
+async def get_db():
     """Provide a database session to route handlers.
 
-    This is a generator that yields a session and ensures it's closed
+    This is an async generator that yields a session and ensures it's closed
     even if an error occurs. FastAPI handles the yield automatically.
 
-    Usage in handlers: db: Session = Depends(get_db)
+    Usage in handlers: db: AsyncSession = Depends(get_db)
     """
-    db = SessionLocal()
-    try:
+    # The context manager always closes the session, whether successful or not
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        # Always close the connection, whether successful or not
-        db.close()
-
-
-# ============================================================================
-# SECTION 4: Application Startup
-# ============================================================================
-# When the API starts, we wait for the database to be ready and create tables.
-# This is important in Docker where MySQL might not be ready immediately.
-
-
-@app.on_event("startup")
-def on_startup():
-    """Initialize the application on startup.
-
-    - Wait up to 15 seconds for the database to become available
-    - Create all tables defined in our ORM models
-    """
-    # Try to connect to the database, with retry logic
-    for attempt in range(15):
-        try:
-            conn = engine.connect()
-            conn.close()
-            logger.info("✓ Database connection successful")
-            break
-        except OperationalError:
-            # Database not ready yet, wait and retry
-            if attempt < 14:  # Don't sleep on the last attempt
-                logger.info(
-                    f"Database not ready, retrying... (attempt {attempt + 1}/15)"
-                )
-                time.sleep(1)
-
-    # Create all database tables (if they don't exist)
-    Base.metadata.create_all(bind=engine)
-    logger.info("✓ Database tables created")
 
 
 # ============================================================================
@@ -146,10 +283,22 @@ def on_startup():
 # - It validates input (done by Pydantic schemas)
 # - It delegates business logic to the CRUD layer
 # - It formats the response
+#
+# Handlers serialize their responses themselves (with orjson) and return
+# them directly, so FastAPI skips its own per-request response_model
+# validation. response_model is still declared so the OpenAPI docs
+# describe the responses.
+
+# Short-lived cache of GET /tasks responses; writes below invalidate it.
+# Off by default - it is per worker process, so only enable it (e.g.
+# TASK_LIST_CACHE_TTL=1) when running a single worker (see cache.py)
+task_list_cache = TaskListCache(ttl=float(os.getenv("TASK_LIST_CACHE_TTL", "0")))
 
 
-@app.post("/tasks", response_model=schemas.TaskRead)
-def create_task(task: schemas.TaskCreate, db: Session = Depends(get_db)):
+@fastapi_app.post("/tasks", response_model=schemas.TaskRead)
+async def create_task(
+    task: schemas.TaskCreate, db: AsyncSession = Depends(get_db)
+):
     """Create a new task.
 
     The client sends a title and optional description.
@@ -162,15 +311,18 @@ def create_task(task: schemas.TaskCreate, db: Session = Depends(get_db)):
     Returns:
         The created Task with its ID and timestamp
     """
-    return crud.create_task(db, task)
+    created = await crud.create_task(db, task)
+    task_list_cache.invalidate()
+    return ORJSONResponse(schemas.TaskRead.model_validate(created).model_dump())
 
 
-@app.get("/tasks", response_model=list[schemas.TaskRead])
-def list_tasks(limit: int = 5, db: Session = Depends(get_db)):
+@fastapi_app.get("/tasks", response_model=list[schemas.TaskRead])
+async def list_tasks(limit: int = 5, db: AsyncSession = Depends(get_db)):
     """Get recent incomplete tasks.
 
     Returns the newest incomplete tasks, limited to avoid overwhelming
-    the frontend with too much data.
+    the frontend with too much data. If the task list cache is enabled,
+    repeated identical reads within its TTL only query the database once.
 
     Args:
         limit: Maximum tasks to return (default: 5, query param: ?limit=10)
@@ -179,11 +331,26 @@ def list_tasks(limit: int = 5, db: Session = Depends(get_db)):
     Returns:
         List of Task objects sorted by newest first
     """
-    return crud.get_recent_tasks(db, limit)
-
-
-@app.patch("/tasks/{task_id}/complete", response_model=schemas.TaskRead)
-def complete_task(task_id: int, db: Session = Depends(get_db)):
+    if not task_list_cache.enabled:
+        rows = await crud.get_recent_tasks(db, limit)
+        return Response(schemas.dump_task_rows(rows), media_type="application/json")
+
+    body = task_list_cache.get(limit)
+    if body is None:
+        async with task_list_cache.lock(limit):
+            # Another request may have filled the cache while we waited
+            body = task_list_cache.get(limit)
+            if body is None:
+                generation = task_list_cache.generation
+                rows = await crud.get_recent_tasks(db, limit)
+                body = schemas.dump_task_rows(rows)
+                task_list_cache.set(limit, body, generation)
+
+    return Response(body, media_type="application/json")
+
+
+@fastapi_app.patch("/tasks/{task_id}/complete", response_model=schemas.TaskRead)
+async def complete_task(task_id: int, db: AsyncSession = Depends(get_db)):
     """Mark a task as complete.
 
     Updates the task's completed status to true. If the task ID doesn't
@@ -199,24 +366,21 @@ def complete_task(task_id: int, db: Session = Depends(get_db)):
     Raises:
         HTTPException: 404 if task is not found
     """
-    task = crud.mark_task_completed(db, task_id)
+    task = await crud.mark_task_completed(db, task_id)
 
     if not task:
         # Task doesn't exist - return a proper HTTP error
         raise HTTPException(status_code=404, detail="Task not found")
 
-    return task
+    task_list_cache.invalidate()
+    return ORJSONResponse(schemas.TaskRead.model_validate(task).model_dump())
 
 
-@app.get("/api/health")
-def health_check():
-    """Health check endpoint for monitoring.
-
-    Returns a simple status to confirm the API is running and responsive.
-    This is typically used by load balancers, Docker, or monitoring systems
-    to ensure the application is healthy.
+# ============================================================================
+# SECTION 6: ASGI Entry Point
+# ============================================================================
+# Health probes are answered by a thin ASGI wrapper before any middleware runs
+# (see health_interceptor.py). 'app' is what uvicorn serves; tests use
+# 'fastapi_app' directly for dependency_overrides.
 
-    Returns:
-        dict with status "ok"
-    """
-    return {"status": "ok"}
+app = HealthCheckInterceptor(fastapi_app)
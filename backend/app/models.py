@@ -6,7 +6,7 @@
 # and work the same way with SQLAlchemy.
 # ============================================================================
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, func
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index, func
 from .database import Base
 
 
@@ -19,6 +19,11 @@ class Task(Base):
 
     __tablename__ = "task"
 
+    # The main query (crud.get_recent_tasks) filters on 'completed' and sorts
+    # by 'created_at DESC' with a LIMIT. This composite index serves both:
+    # MySQL walks it backwards and stops after LIMIT rows, with no filesort
+    __table_args__ = (Index("ix_task_completed_created", "completed", "created_at"),)
+
     # Primary key - uniquely identifies each task
     id = Column(Integer, primary_key=True, index=True)
 
@@ -29,11 +34,14 @@ class Task(Base):
     description = Column(String(1000), nullable=True)
 
     # Tracks whether the task is done or not
-    # We index this because we often filter by completion status
-    completed = Column(Boolean, default=False, nullable=False, index=True)
+    # Indexed together with created_at (see __table_args__ above)
+    completed = Column(Boolean, default=False, nullable=False)
 
     # Timestamp for when the task was created
-    # Database automatically sets this to the current time (server-side)
+    # Stored as naive UTC (MySQL DATETIME keeps no time zone). The database
+    # sets it by default (server-side NOW(), in UTC because app sessions run
+    # with time_zone='+00:00'); crud.create_task supplies it explicitly to
+    # avoid reading it back
     created_at = Column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
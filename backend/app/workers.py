@@ -0,0 +1,16 @@
+# ============================================================================
+# Gunicorn Worker Class
+# ============================================================================
+# The stock UvicornWorker picks its event loop and HTTP parser with "auto",
+# silently falling back to asyncio + h11 (pure Python) when uvloop/httptools
+# are missing. Both ship with uvicorn[standard]; this worker requires them,
+# so a broken image fails at startup instead of quietly running slower.
+# ============================================================================
+
+from uvicorn.workers import UvicornWorker
+
+
+class UvloopHttptoolsWorker(UvicornWorker):
+    """UvicornWorker that always runs on uvloop with the httptools parser."""
+
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools"}
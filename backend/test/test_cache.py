@@ -0,0 +1,59 @@
+# ============================================================================
+# Unit Tests for the Task List Cache
+# ============================================================================
+# These tests exercise TaskListCache directly (no HTTP, no database), for the
+# behaviors that are hard to trigger through the API: the generation guard
+# against caching stale reads, and per-limit locking.
+# ============================================================================
+
+from app.cache import TaskListCache
+
+
+def test_cached_body_is_returned_within_ttl():
+    """Test that a stored body is served back for the same limit only."""
+    # ARRANGE & ACT: Store a body for limit=5
+    cache = TaskListCache(ttl=60)
+    cache.set(5, b"[]", cache.generation)
+
+    # ASSERT: It is served for limit=5, not for another limit
+    assert cache.get(5) == b"[]"
+    assert cache.get(10) is None
+
+
+def test_read_that_overlapped_a_write_is_not_cached():
+    """Test the generation guard.
+
+    Arrange: A read starts and remembers the current generation
+    Act: A write invalidates the cache before the read stores its result
+    Assert: The (possibly stale) result is not cached
+    """
+    # ARRANGE: A read starts
+    cache = TaskListCache(ttl=60)
+    generation = cache.generation
+
+    # ACT: A write lands mid-read, then the read finishes
+    cache.invalidate()
+    cache.set(5, b'[{"id": 1}]', generation)
+
+    # ASSERT: Nothing was cached
+    assert cache.get(5) is None
+
+
+def test_disabled_cache_stores_nothing():
+    """Test that a ttl of 0 (the default) turns the cache off."""
+    # ARRANGE & ACT: Try to store a body in a disabled cache
+    cache = TaskListCache()
+    cache.set(5, b"[]", cache.generation)
+
+    # ASSERT: It is disabled and nothing is served back
+    assert not cache.enabled
+    assert cache.get(5) is None
+
+
+def test_locks_are_per_limit():
+    """Test that misses for different limits don't wait for each other."""
+    cache = TaskListCache(ttl=60)
+
+    # ASSERT: Same limit shares a lock, different limits don't
+    assert cache.lock(5) is cache.lock(5)
+    assert cache.lock(5) is not cache.lock(10)
@@ -14,13 +14,17 @@
 # - Single Responsibility: Each test tests one thing
 # ============================================================================
 
+import re
+import asyncio
+import time
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from app.database import Base, get_db
-from app.main import app
-from app import models
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+from app import main, schemas
+from app.cache import TaskListCache
+from app.main import app, fastapi_app, get_db
 
 
 # ============================================================================
@@ -28,19 +32,18 @@ from app import models
 # ============================================================================
 # Use an in-memory SQLite database for fast, isolated tests.
 # This means each test run gets a fresh database - no side effects between tests.
+# Every new connection to ":memory:" would see its own empty database, so
+# StaticPool hands out the same single connection on every checkout.
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite://"
 
-# Create an engine for the test database
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+# Create an async engine for the test database (aiosqlite mirrors asyncmy's API)
+engine = create_async_engine(SQLALCHEMY_DATABASE_URL, poolclass=StaticPool)
 
 # Create a session factory for the test database
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-# Create all tables in the test database before running tests
-Base.metadata.create_all(bind=engine)
+TestingSessionLocal = async_sessionmaker(
+    bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
 
 
 # ============================================================================
@@ -51,24 +54,37 @@ Base.metadata.create_all(bind=engine)
 # The app doesn't change - we just swap out the dependency.
 
 
-def override_get_db():
+async def override_get_db():
     """Provide a test database session instead of the real one.
 
     This function has the same signature as the real get_db(), so FastAPI
     will use it transparently whenever a test makes a request.
     """
-    db = TestingSessionLocal()
-    try:
+    async with TestingSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 # Tell FastAPI: "Whenever you need get_db, use our override function instead"
-app.dependency_overrides[get_db] = override_get_db
+fastapi_app.dependency_overrides[get_db] = override_get_db
+
 
-# Create a test client that can make requests without a running server
-client = TestClient(app)
+@pytest.fixture(scope="module")
+def client():
+    """Provide a test client that can make requests without a running server.
+
+    Entering the client runs the app's real lifespan - pointed at the test
+    engine, with RUN_DDL=1 so it creates the tables - and keeps one event
+    loop for every request in the module.
+
+    The task list cache is enabled with a long TTL, so any write that failed
+    to invalidate it would show up as a stale list in the tests below.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(main, "engine", engine)
+        mp.setattr(main, "task_list_cache", TaskListCache(ttl=60))
+        mp.setenv("RUN_DDL", "1")
+        with TestClient(app) as test_client:
+            yield test_client
 
 
 # ============================================================================
@@ -77,7 +93,7 @@ client = TestClient(app)
 # Each test is isolated and tests ONE behavior
 
 
-def test_create_and_get_tasks():
+def test_create_and_get_tasks(client):
     """Test that we can create a task and retrieve it.
 
     Arrange: None (starting fresh)
@@ -104,7 +120,40 @@ def test_create_and_get_tasks():
     assert tasks[0]["title"] == "Task 1"
 
 
-def test_mark_task_complete():
+def test_created_task_matches_listed_task(client):
+    """Test that the POST response matches what later reads return.
+
+    The API generates created_at itself (so the INSERT needs no read-back);
+    the value it returns must be exactly the one that was stored.
+    Arrange: None
+    Act: Create a task, then list tasks
+    Assert: The listed task's created_at equals the one from the POST
+    """
+    # ACT: Create a task and read the list
+    created = client.post("/tasks", json={"title": "Timestamped"}).json()
+    listed = {t["id"]: t for t in client.get("/tasks").json()}
+
+    # ASSERT: Same timestamp in both responses
+    assert listed[created["id"]]["created_at"] == created["created_at"]
+
+
+def test_listed_tasks_have_the_task_read_shape(client):
+    """Test that /tasks items look exactly like single-task responses.
+
+    The list is serialized without going through TaskRead, so this guards
+    against the two drifting apart (e.g. a field added to TaskRead only).
+    """
+    # ACT: Create a task and read the list
+    created = client.post("/tasks", json={"title": "Shape", "description": "d"})
+    listed = {t["id"]: t for t in client.get("/tasks").json()}
+    item = listed[created.json()["id"]]
+
+    # ASSERT: Exactly TaskRead's fields, formatted like the POST response
+    assert set(item) == set(schemas.TaskRead.model_fields)
+    assert item == created.json()
+
+
+def test_mark_task_complete(client):
     """Test that we can mark a task as completed.
 
     Arrange: Create a task
@@ -133,7 +182,103 @@ def test_mark_task_complete():
     assert task_id not in incomplete_task_ids
 
 
-def test_get_nonexistent_task():
+def test_task_list_cache_is_invalidated_on_create(client):
+    """Test that a cached task list never hides a newly created task.
+
+    Arrange: Read the list so it gets cached
+    Act: Create a task, then read the list again within the cache TTL
+    Assert: The new task is in the list
+    """
+    # ARRANGE: Fill the cache
+    client.get("/tasks")
+
+    # ACT: Create a task and read the list straight away
+    task_id = client.post("/tasks", json={"title": "Fresh"}).json()["id"]
+    r = client.get("/tasks")
+
+    # ASSERT: The write invalidated the cached list
+    assert r.status_code == 200
+    assert task_id in [t["id"] for t in r.json()]
+
+
+def test_task_list_cache_is_invalidated_on_complete(client):
+    """Test that a cached task list never shows a task that was completed.
+
+    Arrange: Create a task and read the list so it gets cached
+    Act: Complete the task, then read the list again within the cache TTL
+    Assert: The completed task is gone from the list
+    """
+    # ARRANGE: Create a task and fill the cache with a list containing it
+    task_id = client.post("/tasks", json={"title": "Soon done"}).json()["id"]
+    assert task_id in [t["id"] for t in client.get("/tasks").json()]
+
+    # ACT: Complete it and read the list straight away
+    client.patch(f"/tasks/{task_id}/complete")
+    r = client.get("/tasks")
+
+    # ASSERT: The write invalidated the cached list
+    assert task_id not in [t["id"] for t in r.json()]
+
+
+class UnresponsiveEngine:
+    """Stand-in for a database that accepts connections but never answers."""
+
+    def connect(self):
+        return self
+
+    async def __aenter__(self):
+        # Like a MySQL handshake that never gets a reply
+        await asyncio.Event().wait()
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+def test_startup_gives_up_on_unresponsive_database(monkeypatch):
+    """Test that the startup wait is bounded even if a probe hangs.
+
+    Arrange: A database that never answers, and a short startup deadline
+    Act: Run the app's lifespan
+    Assert: Startup finishes shortly after the deadline instead of hanging
+    """
+    # ARRANGE: Point the app at the unresponsive database
+    monkeypatch.setattr(main, "engine", UnresponsiveEngine())
+    monkeypatch.setattr(main, "DB_STARTUP_DEADLINE", 0.3)
+    monkeypatch.delenv("RUN_DDL", raising=False)
+
+    async def start_and_stop():
+        async with main.lifespan(fastapi_app):
+            pass
+
+    # ACT: Start up (the outer timeout only stops a broken test hanging)
+    started = time.monotonic()
+    asyncio.run(asyncio.wait_for(start_and_stop(), timeout=5))
+
+    # ASSERT: We gave up at the deadline
+    assert time.monotonic() - started < 2
+
+
+def test_cors_preflight_from_allowed_origin(client):
+    """Test that cross-origin preflights still get CORS headers.
+
+    Requests without an Origin skip CORS processing, so make sure the ones
+    that carry one (from an allowed origin) are still handled.
+    """
+    # ACT: Send a preflight from the default allowed origin
+    r = client.options(
+        "/tasks",
+        headers={
+            "Origin": "http://localhost:3000",
+            "Access-Control-Request-Method": "POST",
+        },
+    )
+
+    # ASSERT: The browser is allowed to make the request
+    assert r.status_code == 200
+    assert r.headers["access-control-allow-origin"] == "http://localhost:3000"
+
+
+def test_get_nonexistent_task(client):
     """Test that requesting a nonexistent task returns 404.
 
     Arrange: Use an ID that doesn't exist
@@ -148,7 +293,7 @@ def test_get_nonexistent_task():
     assert "Task not found" in r.json()["detail"]
 
 
-def test_health_check():
+def test_health_check(client):
     """Test that the health check endpoint works.
 
     This is a simple endpoint used by monitoring systems.
@@ -159,3 +304,81 @@ def test_health_check():
     # ASSERT: It returns 200 and says everything is ok
     assert r.status_code == 200
     assert r.json()["status"] == "ok"
+
+
+def test_health_check_rejects_other_methods(client):
+    """Test that the health endpoint only answers GET requests.
+
+    Probes are intercepted before routing, so the 405 must come from there.
+    """
+    # ACT: Call the health endpoint with the wrong method
+    r = client.post("/api/health")
+
+    # ASSERT: It is rejected and tells the caller which method is allowed
+    assert r.status_code == 405
+    assert r.headers["allow"] == "GET"
+
+
+def test_static_assets_are_revalidated(client):
+    """Test that unhashed static assets must be revalidated by the browser.
+
+    They carry an ETag so revalidation is a cheap 304 instead of a re-download.
+    """
+    # ACT: Fetch a static asset
+    r = client.get("/static/app.js")
+
+    # ASSERT: Browsers must revalidate it, using its ETag
+    assert r.status_code == 200
+    assert r.headers["cache-control"] == "no-cache"
+
+    # ACT: Revalidate with the ETag we were given
+    r = client.get("/static/app.js", headers={"if-none-match": r.headers["etag"]})
+
+    # ASSERT: Nothing changed, so no body is re-sent
+    assert r.status_code == 304
+
+
+def test_versioned_static_assets_are_immutable(client):
+    """Test that asset URLs linked from the page are cached forever.
+
+    Arrange: Find the versioned app.js URL in the index page
+    Act: Fetch it, and fetch it again with an outdated version
+    Assert: Only the current version is marked immutable
+    """
+    # ARRANGE: The page links app.js with a content hash
+    page = client.get("/").text
+    match = re.search(r'src="(/static/app\.js\?v=[0-9a-f]+)"', page)
+    assert match, "index.html should link a versioned app.js"
+
+    # ACT: Fetch the versioned URL
+    r = client.get(match.group(1))
+
+    # ASSERT: Browsers may cache it without ever revalidating
+    assert r.status_code == 200
+    assert r.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+    # ACT: Fetch it with a version that doesn't match its contents
+    r = client.get("/static/app.js?v=outdated")
+
+    # ASSERT: That one must still be revalidated
+    assert r.headers["cache-control"] == "no-cache"
+
+
+def test_frontend_page_supports_etag(client):
+    """Test that the preloaded index page can be revalidated with its ETag.
+
+    Arrange: Fetch the page once to learn its ETag
+    Act: Fetch it again with If-None-Match
+    Assert: Get a 304 with no body
+    """
+    # ARRANGE: Fetch the page
+    r = client.get("/")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/html")
+
+    # ACT: Revalidate with the ETag we were given
+    r = client.get("/", headers={"if-none-match": r.headers["etag"]})
+
+    # ASSERT: Nothing changed, so no body is re-sent
+    assert r.status_code == 304
+    assert r.content == b""
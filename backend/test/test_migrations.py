@@ -0,0 +1,83 @@
+# ============================================================================
+# Tests for the Alembic Migrations
+# ============================================================================
+# The schema can be created two ways: by 'alembic upgrade head', or by
+# create_all on startup (RUN_DDL=1). Both must end up upgradeable, so these
+# tests run the migrations against a throwaway SQLite database file.
+# ============================================================================
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.database import Base
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def database_url(tmp_path):
+    """Provide the URL of an empty SQLite database file."""
+    return f"sqlite+aiosqlite:///{tmp_path / 'migrations.db'}"
+
+
+def alembic_config(url: str) -> Config:
+    """Build an Alembic config for 'url' (without alembic.ini's logging)."""
+    config = Config()
+    config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    config.set_main_option("sqlalchemy.url", url)
+    return config
+
+
+async def inspect_database(url: str, create_tables: bool = False):
+    """Optionally create_all, then return {table: set of index names}."""
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        if create_tables:
+            await conn.run_sync(Base.metadata.create_all)
+
+        def index_names(sync_conn):
+            inspector = inspect(sync_conn)
+            return {
+                table: {index["name"] for index in inspector.get_indexes(table)}
+                for table in inspector.get_table_names()
+            }
+
+        indexes = await conn.run_sync(index_names)
+    await engine.dispose()
+    return indexes
+
+
+def test_upgrade_head_on_empty_database(database_url):
+    """Test that migrating a fresh database gives the models' indexes."""
+    # ACT: Run all migrations
+    command.upgrade(alembic_config(database_url), "head")
+
+    # ASSERT: The task table has the composite index, not the old one
+    indexes = asyncio.run(inspect_database(database_url))
+    assert "ix_task_completed_created" in indexes["task"]
+    assert "ix_task_completed" not in indexes["task"]
+
+
+def test_upgrade_head_after_create_all(database_url):
+    """Test that a database created by RUN_DDL=1 can still be migrated.
+
+    Arrange: Create the schema from the current models (create_all)
+    Act: Run all migrations
+    Assert: They succeed and leave the indexes as the models define them
+    """
+    # ARRANGE: Bootstrap the way the RUN_DDL=1 startup path does
+    asyncio.run(inspect_database(database_url, create_tables=True))
+
+    # ACT: Run all migrations
+    command.upgrade(alembic_config(database_url), "head")
+
+    # ASSERT: Same indexes as before
+    indexes = asyncio.run(inspect_database(database_url))
+    assert "ix_task_completed_created" in indexes["task"]
+    assert "ix_task_completed" not in indexes["task"]